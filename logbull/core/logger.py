@@ -19,9 +19,11 @@ def _generate_unique_nanosecond_timestamp() -> int:
     """
     global _last_timestamp_ns
 
-    with _timestamp_lock:
-        current_timestamp_ns = time.time_ns()
+    # Reading the clock before taking the lock keeps the critical section to a
+    # compare-and-store; ordering is still decided under the lock
+    current_timestamp_ns = time.time_ns()
 
+    with _timestamp_lock:
         # Ensure monotonic timestamps
         if current_timestamp_ns <= _last_timestamp_ns:
             current_timestamp_ns = _last_timestamp_ns + 1
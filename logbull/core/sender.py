@@ -1,9 +1,9 @@
 import json
 import threading
 import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from queue import Empty, Queue
-from typing import List, Optional
+from typing import Deque, List, Optional
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
@@ -21,7 +21,9 @@ class LogSender:
         self.batch_size = min(config.get("batch_size", 1000), 1000)
         self.batch_interval = 1.0
 
-        self._log_queue: Queue[LogEntry] = Queue()
+        # deque append/extend/popleft are atomic under the GIL, so producers
+        # and the batch processor share the queue without an explicit lock
+        self._log_queue: Deque[LogEntry] = deque()
         self._batch_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._thread_init_lock = threading.Lock()
@@ -45,23 +47,30 @@ class LogSender:
         if self._stop_event.is_set():
             return
 
-        # Initialize thread lazily on first log
-        if not self._thread_started:
-            with self._thread_init_lock:
-                if not self._thread_started:
-                    self._start_batch_processor()
-                    self._thread_started = True
-
         try:
-            self._log_queue.put(log_entry, timeout=0.1)
-            queue_size = self._log_queue.qsize()
+            self._ensure_batch_processor_started()
+            self._log_queue.append(log_entry)
 
-            if queue_size >= self.batch_size:
+            if len(self._log_queue) >= self.batch_size:
                 self._send_queued_logs()
 
         except Exception as e:
             print(f"LogBull: Failed to add log to queue: {e}")
 
+    def add_logs_to_queue(self, log_entries: List[LogEntry]) -> None:
+        if self._stop_event.is_set() or not log_entries:
+            return
+
+        try:
+            self._ensure_batch_processor_started()
+            self._log_queue.extend(log_entries)
+
+            if len(self._log_queue) >= self.batch_size:
+                self._send_queued_logs()
+
+        except Exception as e:
+            print(f"LogBull: Failed to add logs to queue: {e}")
+
     def send_logs(self, logs: List[LogEntry]) -> LogBullResponse:
         if not logs:
             return {"accepted": 0, "rejected": 0, "message": "No logs to send"}
@@ -80,7 +89,11 @@ class LogSender:
         return self._send_http_request(batch)
 
     def flush(self) -> None:
-        self._send_queued_logs()
+        # Each pass sends at most batch_size entries, so drain everything queued
+        # so far without chasing entries producers keep adding meanwhile
+        pending_batches = -(-len(self._log_queue) // self.batch_size)
+        for _ in range(pending_batches):
+            self._send_queued_logs()
 
         # Wait for currently submitted tasks to complete
         if self._executor:
@@ -174,6 +187,14 @@ class LogSender:
                     target=lambda: old_executor.shutdown(wait=True), daemon=True
                 ).start()
 
+    def _ensure_batch_processor_started(self) -> None:
+        # Initialize thread lazily on first log
+        if not self._thread_started:
+            with self._thread_init_lock:
+                if not self._thread_started:
+                    self._start_batch_processor()
+                    self._thread_started = True
+
     def _start_batch_processor(self) -> None:
         self._batch_thread = threading.Thread(
             target=self._batch_processor_loop,
@@ -200,11 +221,10 @@ class LogSender:
 
         logs_to_send: List[LogEntry] = []
 
-        while len(logs_to_send) < self.batch_size and not self._log_queue.empty():
+        while len(logs_to_send) < self.batch_size:
             try:
-                log_entry = self._log_queue.get(timeout=0.1)
-                logs_to_send.append(log_entry)
-            except Empty:
+                logs_to_send.append(self._log_queue.popleft())
+            except IndexError:
                 break
 
         if logs_to_send:
@@ -1,52 +1,117 @@
 """Structlog integration processor for LogBull."""
 
-from typing import Any, Dict, Optional
+import functools
+import sys
+from typing import Any, Callable, Dict, FrozenSet, Optional
 
-from ..core.logger import _generate_unique_nanosecond_timestamp
+from ..core.logger import LogBullLogger, _generate_unique_nanosecond_timestamp
 from ..core.sender import LogSender
 from ..core.types import LogBullConfig, LogEntry
 from ..utils import LogFormatter, LogValidator
+from ..utils.validation import VALID_LOG_LEVELS
+
+
+_RESERVED_KEYS: FrozenSet[str] = frozenset(("level", "event", "timestamp"))
+
+# Known level names map straight to their interned upper-case form, so the
+# common case skips allocating a new string with .upper() per event
+_UPPERCASE_LEVELS: Dict[str, str] = {
+    name: sys.intern(level)
+    for level in VALID_LOG_LEVELS
+    for name in (level, level.lower())
+}
+
+_LEVEL_PRIORITY = LogBullLogger.LOG_LEVEL_PRIORITY
+
+_DISABLED_NOTIFICATION = (
+    "LogBull: No credentials provided for StructlogProcessor. "
+    "Processor is disabled. Logs will not be sent to LogBull server."
+)
+_disabled_notified = False
+
+# Both only hold their default limits, so every processor can share them
+_VALIDATOR = LogValidator()
+_FORMATTER = LogFormatter(validator=_VALIDATOR)
+
+
+@functools.lru_cache(maxsize=32)
+def _validate_config_cached(
+    project_id: str, host: str, api_key: Optional[str]
+) -> Dict[str, Any]:
+    # The returned dict is shared between callers and must not be mutated
+    return _VALIDATOR.validate_config(
+        project_id=project_id,
+        host=host,
+        api_key=api_key,
+    )
+
+
+def _notify_disabled_once() -> None:
+    global _disabled_notified
+
+    # Flag is set before printing so concurrent constructors rarely double-print
+    if not _disabled_notified:
+        _disabled_notified = True
+        print(_DISABLED_NOTIFICATION)
 
 
 class StructlogProcessor:
     """Structlog processor that sends logs to LogBull server."""
 
+    __slots__ = (
+        "validator",
+        "formatter_util",
+        "disabled",
+        "config",
+        "sender",
+        "log_level",
+        "min_level_priority",
+        "_is_valid",
+        "_build_log_entry",
+        "_enqueue",
+    )
+
+    # Shared by every disabled instance, so it must never be mutated
+    _DISABLED_CONFIG: LogBullConfig = {
+        "project_id": "",
+        "host": "",
+        "api_key": None,
+        "batch_size": 1000,
+    }
+
     def __init__(
         self,
         *,
         project_id: Optional[str] = None,
         host: Optional[str] = None,
         api_key: Optional[str] = None,
+        log_level: str = "DEBUG",
     ):
-        self.validator = LogValidator()
-        self.formatter_util = LogFormatter()
+        self.validator = _VALIDATOR
+        self.formatter_util = _FORMATTER
+
+        self.log_level = self.validator.validate_log_level(str(log_level))
+        self.min_level_priority = _LEVEL_PRIORITY[self.log_level]
+
+        # Bound once so the per-event path does a single attribute load
+        self._is_valid = self.validator.is_valid_fast
+        self._build_log_entry = self.formatter_util._build_prechecked_entry
+        self._enqueue: Optional[Callable[[LogEntry], None]] = None
 
         # Check if credentials are provided
         self.disabled = project_id is None or host is None
 
         if self.disabled:
             # No credentials: do nothing (Structlog will print)
-            print(
-                "LogBull: No credentials provided for StructlogProcessor. "
-                "Processor is disabled. Logs will not be sent to LogBull server."
-            )
-            self.config: LogBullConfig = {
-                "project_id": "",
-                "host": "",
-                "api_key": None,
-                "batch_size": 1000,
-            }
+            _notify_disabled_once()
+            self.config: LogBullConfig = self._DISABLED_CONFIG
             self.sender = None
         else:
             # Validate configuration
             # At this point, project_id and host are guaranteed to be non-None
             assert project_id is not None
             assert host is not None
-            validated_config = self.validator.validate_config(
-                project_id=project_id,
-                host=host,
-                api_key=api_key,
-            )
+            validated_config = _validate_config_cached(project_id, host, api_key)
 
             self.config = {
                 "project_id": validated_config["project_id"],
@@ -56,54 +121,53 @@ class StructlogProcessor:
             }
 
             self.sender = LogSender(self.config)
+            self._enqueue = self.sender.add_log_to_queue
 
     def __call__(
         self, logger: Any, name: str, event_dict: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Process a Structlog event and send to LogBull."""
-        # If processor is disabled, do nothing (just pass through)
-        if self.disabled or self.sender is None:
+        # _enqueue is None exactly when the processor is disabled, so a single
+        # check covers both. Swapping __call__ on the instance would not help:
+        # implicit calls look the special method up on the type.
+        enqueue = self._enqueue
+        if enqueue is None:
             return event_dict
 
         try:
             # Extract information from event_dict
-            level = event_dict.get("level", "info").upper()
-            message = str(event_dict.get("event", ""))
-
-            # Extract fields (everything except reserved keys)
-            reserved_keys = {"level", "event", "timestamp"}
-            fields = {
-                key: value
-                for key, value in event_dict.items()
-                if key not in reserved_keys
-            }
+            raw_level = event_dict.get("level", "info")
+            level = _UPPERCASE_LEVELS.get(raw_level) or raw_level.upper()
+
+            # Drop events below log_level before any formatting work. Unknown
+            # levels are left to the validity check below.
+            min_level_priority = self.min_level_priority
+            if _LEVEL_PRIORITY.get(level, min_level_priority) < min_level_priority:
+                return event_dict
 
-            # Add logger name if available
-            if name:
-                fields["logger_name"] = name
+            event = event_dict.get("event", "")
+            message = event if event.__class__ is str else str(event)
 
-            # Validate log entry
-            validated = self.validator.validate_log_entry(level, message, fields)
+            # Events the validator would reject are skipped without raising;
+            # field errors are still reported while the entry is built
+            if not self._is_valid(level, message):
+                return event_dict
 
             # Generate unique timestamp with nanosecond precision
             timestamp_ns = _generate_unique_nanosecond_timestamp()
 
-            # Format log entry
-            formatted_entry = self.formatter_util.format_log_entry(
-                level=validated["level"],
-                message=validated["message"],
-                fields=validated["fields"],
-                timestamp_ns=timestamp_ns,
+            # Reserved keys are skipped while the formatter walks event_dict,
+            # so no filtered copy of it is built here
+            log_entry = self._build_log_entry(
+                level,
+                message,
+                event_dict,
+                timestamp_ns,
+                exclude_fields=_RESERVED_KEYS,
+                logger_name=name,
             )
 
-            log_entry: LogEntry = {
-                "level": formatted_entry["level"],
-                "message": formatted_entry["message"],
-                "timestamp": formatted_entry["timestamp"],
-                "fields": formatted_entry["fields"],
-            }
-
-            self.sender.add_log_to_queue(log_entry)
+            enqueue(log_entry)
 
         except Exception as e:
             # Print error instead of raising to avoid breaking Structlog pipeline
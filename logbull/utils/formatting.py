@@ -3,12 +3,38 @@
 import json
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict, FrozenSet, Optional
+
+
+if TYPE_CHECKING:
+    from ..core.types import LogEntry
+    from .validation import LogValidator
+
+# Exact types json.dumps always accepts; subclasses still go through json.dumps
+_JSON_SCALAR_TYPES: FrozenSet[type] = frozenset((str, float, bool, type(None)))
+
+# Huge ints can exceed the interpreter's int-to-str digit limit and fail in
+# json.dumps, so only ints well inside that limit skip the check
+_MAX_FAST_JSON_INT = 2**63
 
 
 class LogFormatter:
-    def __init__(self, max_message_length: Optional[int] = None):
+    def __init__(
+        self,
+        max_message_length: Optional[int] = None,
+        validator: Optional["LogValidator"] = None,
+    ):
         self.max_message_length = max_message_length
+        self._validator = validator
+
+    @property
+    def validator(self) -> "LogValidator":
+        # Created on first use: most formatters never build validated entries
+        if self._validator is None:
+            from .validation import LogValidator
+
+            self._validator = LogValidator()
+        return self._validator
 
     def format_timestamp(self, timestamp_ns: Optional[int] = None) -> str:
         """Format timestamp to RFC3339Nano format with nanosecond precision."""
@@ -41,12 +67,7 @@ class LogFormatter:
         formatted_fields = {}
         for key, value in fields.items():
             if isinstance(key, str) and key.strip():
-                formatted_key = key.strip()
-                try:
-                    json.dumps(value)
-                    formatted_fields[formatted_key] = value
-                except (TypeError, ValueError):
-                    formatted_fields[formatted_key] = str(value)
+                formatted_fields[key.strip()] = self._to_json_compatible(value)
 
         return formatted_fields
 
@@ -64,6 +85,27 @@ class LogFormatter:
             "fields": self.ensure_fields(fields),
         }
 
+    def build_log_entry(
+        self,
+        level: str,
+        message: Any,
+        fields: Optional[Dict[str, Any]] = None,
+        timestamp_ns: Optional[int] = None,
+        *,
+        exclude_fields: AbstractSet[str] = frozenset(),
+        logger_name: Optional[str] = None,
+    ) -> "LogEntry":
+        """Validate and format a log entry without intermediate dicts."""
+        validator = self.validator
+        return self._build_prechecked_entry(
+            validator.validate_log_level(level),
+            validator.validate_log_message(message),
+            fields,
+            timestamp_ns,
+            exclude_fields=exclude_fields,
+            logger_name=logger_name,
+        )
+
     def format_batch(
         self, log_entries: list[Dict[str, Any]]
     ) -> Dict[str, list[Dict[str, Any]]]:
@@ -79,6 +121,53 @@ class LogFormatter:
         result.update(context)
         return result
 
+    def _build_prechecked_entry(
+        self,
+        level: str,
+        message: str,
+        fields: Optional[Dict[str, Any]] = None,
+        timestamp_ns: Optional[int] = None,
+        *,
+        exclude_fields: AbstractSet[str] = frozenset(),
+        logger_name: Optional[str] = None,
+    ) -> "LogEntry":
+        # The upper-case level and the message must already have passed
+        # LogValidator.is_valid_fast, so they are only normalised here
+        validator = self.validator
+        to_json_compatible = self._to_json_compatible
+        validate_field_key = validator.validate_field_key
+
+        # Skipping excluded keys here lets callers pass a raw event dict
+        built_fields: Dict[str, Any] = {}
+        if fields:
+            for key, value in fields.items():
+                if key not in exclude_fields:
+                    built_fields[validate_field_key(key)] = to_json_compatible(value)
+        if logger_name:
+            built_fields["logger_name"] = logger_name
+
+        validator.validate_fields_count(built_fields)
+
+        return {
+            "level": validator.normalize_log_level(level.strip()),
+            "message": self.format_message(message),
+            "timestamp": self.format_timestamp(timestamp_ns),
+            "fields": built_fields,
+        }
+
+    def _to_json_compatible(self, value: Any) -> Any:
+        value_type = type(value)
+        if value_type in _JSON_SCALAR_TYPES or (
+            value_type is int and -_MAX_FAST_JSON_INT < value < _MAX_FAST_JSON_INT
+        ):
+            return value
+
+        try:
+            json.dumps(value)
+            return value
+        except (TypeError, ValueError):
+            return str(value)
+
     def _sanitize_field_name(self, name: str) -> str:
         name = name.strip()
 
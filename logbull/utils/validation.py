@@ -39,15 +39,11 @@ class LogValidator:
     def validate_log_level(self, level: str) -> str:
         level_upper = level.strip().upper()
 
-        if not level_upper:
-            raise ValueError("Log level cannot be empty")
-
-        if level_upper not in VALID_LOG_LEVELS:
-            raise ValueError(
-                f"Invalid log level '{level}'. Must be one of: {', '.join(sorted(VALID_LOG_LEVELS))}"
-            )
+        level_error = self._log_level_error(level, level_upper)
+        if level_error:
+            raise ValueError(level_error)
 
-        return self._normalize_log_level(level_upper)
+        return self.normalize_log_level(level_upper)
 
     def validate_project_id(self, project_id: str) -> str:
         project_id = project_id.strip()
@@ -97,14 +93,11 @@ class LogValidator:
 
         message_str = message_str.strip()
 
-        if not message_str:
-            raise ValueError("Log message cannot be empty")
-
-        effective_max_length = max_length or self.max_message_length
-        if len(message_str) > effective_max_length:
-            raise ValueError(
-                f"Log message too long ({len(message_str)} chars). Maximum allowed: {effective_max_length}"
-            )
+        message_error = self._log_message_error(
+            message_str, max_length or self.max_message_length
+        )
+        if message_error:
+            raise ValueError(message_error)
 
         return message_str
 
@@ -114,25 +107,45 @@ class LogValidator:
         if fields is None:
             return None
 
+        self.validate_fields_count(fields)
+
+        validated_fields = {}
+        for key, value in fields.items():
+            validated_fields[self.validate_field_key(key)] = value
+
+        return validated_fields
+
+    def validate_fields_count(self, fields: Dict[str, Any]) -> None:
         if len(fields) > self.max_fields_count:
             raise ValueError(
                 f"Too many fields ({len(fields)}). Maximum allowed: {self.max_fields_count}"
             )
 
-        validated_fields = {}
-        for key, value in fields.items():
-            key = key.strip()
-            if not key:
-                raise ValueError("Field key cannot be empty")
+    def validate_field_key(self, key: str) -> str:
+        key = key.strip()
+        if not key:
+            raise ValueError("Field key cannot be empty")
 
-            if len(key) > self.max_field_key_length:
-                raise ValueError(
-                    f"Field key too long ({len(key)} chars). Maximum: {self.max_field_key_length}"
-                )
+        if len(key) > self.max_field_key_length:
+            raise ValueError(
+                f"Field key too long ({len(key)} chars). Maximum: {self.max_field_key_length}"
+            )
 
-            validated_fields[key] = value
+        return key
 
-        return validated_fields
+    def normalize_log_level(self, level: str) -> str:
+        if level in ("FATAL", "CRITICAL", "PANIC"):
+            return "CRITICAL"
+
+        return level
+
+    def is_valid_fast(self, level: str, message: str) -> bool:
+        """Apply the level and message rules without raising."""
+        return (
+            self._log_level_error(level, level.strip().upper()) is None
+            and self._log_message_error(message.strip(), self.max_message_length)
+            is None
+        )
 
     def validate_log_entry(
         self,
@@ -190,8 +203,20 @@ class LogValidator:
 
         return host
 
-    def _normalize_log_level(self, level: str) -> str:
-        if level in ("FATAL", "CRITICAL", "PANIC"):
-            return "CRITICAL"
+    def _log_level_error(self, level: str, level_upper: str) -> Optional[str]:
+        if not level_upper:
+            return "Log level cannot be empty"
 
-        return level
+        if level_upper not in VALID_LOG_LEVELS:
+            return f"Invalid log level '{level}'. Must be one of: {', '.join(sorted(VALID_LOG_LEVELS))}"
+
+        return None
+
+    def _log_message_error(self, message: str, max_length: int) -> Optional[str]:
+        if not message:
+            return "Log message cannot be empty"
+
+        if len(message) > max_length:
+            return f"Log message too long ({len(message)} chars). Maximum allowed: {max_length}"
+
+        return None
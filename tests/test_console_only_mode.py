@@ -163,7 +163,8 @@ class TestConsoleOnlyMode:
         self, capture_stdout: Mock
     ) -> None:
         """Test StructlogProcessor without credentials is disabled."""
-        processor = StructlogProcessor()
+        with patch("logbull.handlers.structlog._disabled_notified", False):
+            processor = StructlogProcessor()
 
         assert processor is not None
         assert processor.disabled is True
@@ -173,6 +174,16 @@ class TestConsoleOnlyMode:
         notification_call = capture_stdout.call_args_list[0]
         assert "disabled" in notification_call[0][0].lower()
 
+    def test_structlog_processor_notifies_once_per_process(
+        self, capture_stdout: Mock
+    ) -> None:
+        """Test that only the first disabled StructlogProcessor prints."""
+        with patch("logbull.handlers.structlog._disabled_notified", False):
+            StructlogProcessor()
+            StructlogProcessor()
+
+        assert capture_stdout.call_count == 1
+
     def test_structlog_processor_disabled_passes_through(self) -> None:
         """Test that disabled processor passes event through unchanged."""
         processor = StructlogProcessor()
@@ -0,0 +1,55 @@
+"""Tests for fused log entry building in LogFormatter."""
+
+import pytest
+
+from logbull.utils import LogFormatter, LogValidator
+
+
+class TestBuildLogEntry:
+    """Test LogFormatter.build_log_entry validation and formatting."""
+
+    def test_rejects_invalid_level(self) -> None:
+        """Test that unknown levels are rejected like validate_log_level does."""
+        with pytest.raises(ValueError, match="Invalid log level 'trace'"):
+            LogFormatter().build_log_entry("trace", "message", {"a": 1}, 1)
+
+    def test_rejects_empty_message(self) -> None:
+        """Test that blank messages are rejected like validate_log_message does."""
+        with pytest.raises(ValueError, match="Log message cannot be empty"):
+            LogFormatter().build_log_entry("info", "   ")
+
+    def test_normalizes_level_and_message(self) -> None:
+        """Test that valid input is normalized into a LogEntry."""
+        entry = LogFormatter().build_log_entry(
+            "fatal",
+            " Shutdown ",
+            {" key ": "value", "skip": 1},
+            exclude_fields={"skip"},
+        )
+
+        assert entry["level"] == "CRITICAL"
+        assert entry["message"] == "Shutdown"
+        assert entry["fields"] == {"key": "value"}
+
+    @pytest.mark.parametrize(
+        ("level", "message"),
+        [
+            ("info", "ok"),
+            (" warn ", " padded "),
+            ("trace", "ok"),
+            ("", "ok"),
+            ("info", ""),
+            ("info", "x" * 10_001),
+        ],
+    )
+    def test_is_valid_fast_matches_validators(self, level: str, message: str) -> None:
+        """Test that the fast pre-check agrees with the raising validators."""
+        validator = LogValidator()
+        try:
+            validator.validate_log_level(level)
+            validator.validate_log_message(message)
+            expected = True
+        except ValueError:
+            expected = False
+
+        assert validator.is_valid_fast(level, message) is expected
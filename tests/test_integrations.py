@@ -448,3 +448,113 @@ class TestStructlogIntegration:
 
         # Reset
         structlog.reset_defaults()
+
+    def test_structlog_reserved_keys_excluded_from_fields(
+        self,
+        structlog_logger_with_logbull: "structlog.BoundLogger",
+        mock_sender: Mock,
+    ) -> None:
+        """Test that reserved event keys are not sent as fields."""
+        structlog_logger_with_logbull.info("Reserved keys check", request_id="r1")
+
+        fields = mock_sender.add_log_to_queue.call_args[0][0]["fields"]
+
+        assert fields["request_id"] == "r1"
+        # structlog passes the method name as the processor's name argument
+        assert fields["logger_name"] == "info"
+        assert "event" not in fields
+        assert "level" not in fields
+        assert "timestamp" not in fields
+
+    def test_structlog_log_level_filtering(self, mock_sender: Mock) -> None:
+        """Test that events below log_level are not sent."""
+        logbull_processor = StructlogProcessor(
+            project_id="12345678-1234-1234-1234-123456789012",
+            host="http://localhost:4005",
+            log_level="WARNING",
+        )
+
+        event_dict = {"event": "Filtered out", "level": "info"}
+        assert logbull_processor(None, "level_test", event_dict) is event_dict
+        mock_sender.add_log_to_queue.assert_not_called()
+
+        logbull_processor(None, "level_test", {"event": "Kept", "level": "error"})
+
+        mock_sender.add_log_to_queue.assert_called_once()
+        call_args = mock_sender.add_log_to_queue.call_args[0][0]
+        assert call_args["level"] == "ERROR"
+
+    def test_structlog_invalid_log_level_raises_error(self) -> None:
+        """Test that an unknown log_level is rejected."""
+        with pytest.raises(ValueError, match="Invalid log level"):
+            StructlogProcessor(log_level="VERBOSE")
+
+    def test_structlog_invalid_event_skipped(self, mock_sender: Mock) -> None:
+        """Test that events with an invalid level or message are not sent."""
+        logbull_processor = StructlogProcessor(
+            project_id="12345678-1234-1234-1234-123456789012",
+            host="http://localhost:4005",
+        )
+
+        with patch("builtins.print") as mock_print:
+            logbull_processor(None, "invalid_test", {"event": "  ", "level": "info"})
+            logbull_processor(None, "invalid_test", {"event": "x", "level": "trace"})
+
+        mock_sender.add_log_to_queue.assert_not_called()
+        mock_print.assert_not_called()
+
+    def test_structlog_sender_thread_failure_does_not_raise(self) -> None:
+        """Test that a failing sender thread start never reaches the caller."""
+        with patch(
+            "logbull.core.sender.LogSender._start_batch_processor",
+            side_effect=RuntimeError("can't start new thread"),
+        ):
+            logbull_processor = StructlogProcessor(
+                project_id="12345678-1234-1234-1234-123456789012",
+                host="http://localhost:4005",
+            )
+            event_dict = {"event": "Thread start fails", "level": "info"}
+
+            with patch("builtins.print") as mock_print:
+                result = logbull_processor(None, "thread_test", event_dict)
+
+        assert result is event_dict
+        assert "can't start new thread" in mock_print.call_args[0][0]
+        logbull_processor.close()
+
+    def test_structlog_fatal_level_normalized(self, mock_sender: Mock) -> None:
+        """Test that pre-checked levels are still normalized before sending."""
+        logbull_processor = StructlogProcessor(
+            project_id="12345678-1234-1234-1234-123456789012",
+            host="http://localhost:4005",
+        )
+
+        logbull_processor(None, "fatal_test", {"event": " Shutdown ", "level": "fatal"})
+
+        call_args = mock_sender.add_log_to_queue.call_args[0][0]
+        assert call_args["level"] == "CRITICAL"
+        assert call_args["message"] == "Shutdown"
+
+    @pytest.mark.skipif(
+        not hasattr(sys, "get_int_max_str_digits"),
+        reason="int-to-str digit limit requires Python 3.11+",
+    )
+    def test_structlog_unserializable_int_field_not_sent(
+        self, mock_sender: Mock
+    ) -> None:
+        """Test that an int too large to serialize fails only its own event."""
+        logbull_processor = StructlogProcessor(
+            project_id="12345678-1234-1234-1234-123456789012",
+            host="http://localhost:4005",
+        )
+        event_dict = {"event": "Huge int", "level": "info", "value": 10**5000}
+
+        with patch("builtins.print"):
+            result = logbull_processor(None, "int_test", event_dict)
+
+        assert result is event_dict
+        mock_sender.add_log_to_queue.assert_not_called()
+
+        logbull_processor(None, "int_test", {"event": "Small int", "value": 42})
+        call_args = mock_sender.add_log_to_queue.call_args[0][0]
+        assert call_args["fields"]["value"] == 42
@@ -0,0 +1,82 @@
+"""Tests for LogSender queueing and batching."""
+
+from typing import Generator, List
+from unittest.mock import patch
+
+import pytest
+
+from logbull.core.sender import LogSender
+from logbull.core.types import LogEntry
+
+
+class TestLogSender:
+    """Test LogSender queue handling without network calls."""
+
+    @pytest.fixture
+    def sender(self) -> Generator[LogSender, None, None]:
+        """Create a sender with a small batch size and no background loop."""
+        with patch.object(LogSender, "_start_batch_processor"):
+            sender = LogSender(
+                {
+                    "project_id": "12345678-1234-1234-1234-123456789012",
+                    "host": "http://localhost:4005",
+                    "batch_size": 2,
+                }
+            )
+            yield sender
+            sender.shutdown()
+
+    @pytest.fixture
+    def sent_batches(self, sender: LogSender) -> Generator[List[List[str]], None, None]:
+        """Record batches handed to the HTTP layer, in submission order."""
+        batches: List[List[str]] = []
+
+        def record_batch(logs: List[LogEntry]) -> None:
+            batches.append([log["message"] for log in logs])
+            sender._active_requests -= 1
+
+        # A single worker thread keeps execution order equal to submission order
+        with patch.object(
+            sender, "_send_logs_async", side_effect=record_batch
+        ), patch.object(sender, "_resize_executor_if_needed"):
+            yield batches
+
+    def _make_entries(self, count: int) -> List[LogEntry]:
+        return [
+            {
+                "level": "INFO",
+                "message": f"log {index}",
+                "timestamp": "2023-12-01T10:00:00.000000000Z",
+                "fields": {},
+            }
+            for index in range(count)
+        ]
+
+    def test_add_logs_to_queue_and_flush_sends_all_in_order(
+        self, sender: LogSender, sent_batches: List[List[str]]
+    ) -> None:
+        """Test that bulk-queued logs are sent FIFO, split at batch_size."""
+        sender.add_logs_to_queue(self._make_entries(5))
+        sender.flush()
+
+        assert sent_batches == [["log 0", "log 1"], ["log 2", "log 3"], ["log 4"]]
+
+    def test_add_log_to_queue_sends_full_batch(
+        self, sender: LogSender, sent_batches: List[List[str]]
+    ) -> None:
+        """Test that reaching batch_size sends a batch without flushing."""
+        for entry in self._make_entries(3):
+            sender.add_log_to_queue(entry)
+
+        sender.flush()
+
+        assert sent_batches == [["log 0", "log 1"], ["log 2"]]
+
+    def test_add_logs_to_queue_ignores_empty_list(
+        self, sender: LogSender, sent_batches: List[List[str]]
+    ) -> None:
+        """Test that an empty bulk enqueue sends nothing."""
+        sender.add_logs_to_queue([])
+        sender.flush()
+
+        assert sent_batches == []